@@ -7,17 +7,32 @@ from .bls import (
     ProofOfPossession,
     Signature,
     SignKey,
+    ThresholdSignature,
     VerKey,
 )
+from .cache import CacheStats, VerificationCache
 from .error import IndyBlsError
+from .lib import ErrorCode
+from .proof import MultiSigProof, MultiSigProofCodec
+from .trace import OpenTelemetryTracer, Span, get_tracer, set_tracer
 
 __all__ = [
     "Bls",
+    "CacheStats",
+    "ErrorCode",
     "IndyBlsError",
     "Generator",
     "MultiSignature",
+    "MultiSigProof",
+    "MultiSigProofCodec",
+    "OpenTelemetryTracer",
     "ProofOfPossession",
     "Signature",
     "SignKey",
+    "Span",
+    "ThresholdSignature",
+    "VerificationCache",
     "VerKey",
+    "get_tracer",
+    "set_tracer",
 ]
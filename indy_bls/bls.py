@@ -1,72 +1,325 @@
 """Public interface."""
 
+import hashlib
+import hmac
 import logging
+import secrets
+import threading
 
 from ctypes import POINTER, byref, c_bool, c_char_p, c_int32, c_int64, c_ubyte, c_void_p
-from typing import Optional
-from weakref import finalize
-
-from .lib import do_call
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .curve import (
+    CURVE_ORDER,
+    G1_COMPRESSED_BYTES,
+    G2_COMPRESSED_BYTES,
+    compress_g1,
+    compress_g2,
+    decompress_g1,
+    decompress_g2,
+    decode_g2,
+    encode_g2,
+    g2_add,
+    g2_from_affine,
+    g2_to_affine,
+    is_well_formed_g1,
+    is_well_formed_g2,
+    lagrange_coefficients,
+    pippenger,
+    poly_eval,
+    scalar_from_bytes,
+    scalar_to_bytes,
+)
+from . import trace
+from .error import IndyBlsError
+from .lib import ErrorCode, do_call
 
 LOGGER = logging.getLogger(__name__)
 
+# Guards setting the native instance of lazily decoded entities
+_DECODE_LOCK = threading.Lock()
+
+
+class _PointCodec(NamedTuple):
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+    compressed_size: int
+    is_well_formed: Callable[[bytes], bool]
+
+
+_POINT_CODECS = {
+    "G1": _PointCodec(
+        compress_g1, decompress_g1, G1_COMPRESSED_BYTES, is_well_formed_g1
+    ),
+    "G2": _PointCodec(
+        compress_g2, decompress_g2, G2_COMPRESSED_BYTES, is_well_formed_g2
+    ),
+}
+
 
 def _free(method, value):
-    do_call(method, value)
+    # Frees often run from __del__, outside of or within unrelated spans
+    if value is not None:
+        do_call(method, value, traced=False)
 
 
 class BlsEntity:
-    """Base class for BLS Entities."""
+    """
+    Base class for BLS Entities.
+
+    Entities are created for nearly every native call, so they use slots and
+    free the native instance in `__del__` rather than through a `finalize`
+    record, which keeps the Python side of each entity to a single allocation.
+    """
+
+    __slots__ = ("_c_instance", "_bytes", "_compressed", "_canonical")
 
     new_handler = None
     from_bytes_handler = None
     as_bytes_handler = None
     free_handler = None
+    point_group = None
 
-    def __init__(self, c_instance):
+    def __init__(self, c_instance, xbytes=None):
         """Initializer."""
         LOGGER.debug("BlsEntity.__init__: >>> self: %r, instance: %r", self, c_instance)
 
-        self.c_instance = c_instance
-        finalize(self, _free, self.free_handler, c_instance)
+        self._c_instance = c_instance
+        self._bytes = xbytes
+        self._compressed = None
+        self._canonical = None
+
+    def __del__(self):
+        """Free the native instance."""
+        _free(self.free_handler, self._c_instance)
+
+    @property
+    def c_instance(self):
+        """Return the native instance, decoding trusted bytes on first use."""
+        c_instance = self._c_instance
+        if c_instance is None:
+            c_instance = self._decode()
+        return c_instance
+
+    def _decode(self):
+        """Decode the trusted bytes of the entity natively."""
+        xbytes = self._decompressed()
+        if xbytes is None:
+            raise IndyBlsError(f"{type(self).__name__} has been released")
+
+        c_instance = c_void_p()
+        do_call(self.from_bytes_handler, xbytes, len(xbytes), byref(c_instance))
+        with _DECODE_LOCK:
+            decoded = self._c_instance
+            if decoded is None:
+                self._c_instance = decoded = c_instance
+                # Bytes given uncompressed need not be the canonical native
+                # encoding, decompressed ones are and are kept
+                if self._compressed is None:
+                    self._bytes = None
+
+        if decoded is not c_instance:
+            # Another thread decoded the entity first
+            _free(self.free_handler, c_instance)
+        return decoded
+
+    def _decompressed(self):
+        """Return the native encoding, decompressing lazily decoded bytes."""
+        if self._bytes is None and self._compressed is not None:
+            try:
+                self._bytes = _POINT_CODECS[self.point_group].decompress(
+                    self._compressed
+                )
+            except ValueError as e:
+                raise IndyBlsError(str(e), ErrorCode.InvalidStructure) from e
+        return self._bytes
+
+    def release(self):
+        """
+        Free the native instance now instead of on garbage collection.
+
+        Cached encodings are dropped as well, so a released sign key keeps no
+        copy of the secret. Releasing more than once has no effect. Using the
+        entity afterwards in a call that needs the native instance, including
+        `as_bytes`, raises `IndyBlsError`.
+        """
+        c_instance, self._c_instance = self._c_instance, None
+        self._bytes = self._compressed = None
+        _free(self.free_handler, c_instance)
+
+    def __enter__(self):
+        """Enter a context that releases the entity on exit."""
+        return self
+
+    def __exit__(self, *exc):
+        """Release the entity."""
+        self.release()
 
     @classmethod
-    def from_bytes(cls, xbytes):
+    def is_well_formed(cls, xbytes) -> bool:
         """
-        Create a BLS entity from the binary representation.
+        Check the structure of untrusted entity bytes without a native call.
+
+        For points, the length, the prefix or flags and the coordinate range are
+        checked, which rejects most garbage without decoding. Passing the check
+        does not guarantee that `from_bytes` succeeds.
 
         :param xbytes: Bytes representation of Bls entity
-        :return: BLS entity intance
+        :return: true if the bytes are well formed, false otherwise
         """
-        LOGGER.debug("BlsEntity::from_bytes: >>>")
+        codec = _POINT_CODECS.get(cls.point_group)
+        if codec is None:
+            raise ValueError(f"{cls.__name__} is not a curve point")
+        return codec.is_well_formed(xbytes)
 
-        c_instance = c_void_p()
-        do_call(cls.from_bytes_handler, xbytes, len(xbytes), byref(c_instance))
+    @classmethod
+    def check_well_formed(cls, xbytes_list) -> List[bool]:
+        """
+        Check the structure of a batch of untrusted entity bytes.
 
-        res = cls(c_instance)
+        :param xbytes_list: Iterable of bytes representations
+        :return: List of results of `is_well_formed`
+        """
+        codec = _POINT_CODECS.get(cls.point_group)
+        if codec is None:
+            raise ValueError(f"{cls.__name__} is not a curve point")
+        return [codec.is_well_formed(xbytes) for xbytes in xbytes_list]
+
+    @classmethod
+    @trace.traced(
+        "BlsEntity.from_bytes",
+        lambda args: {"entity": args["cls"].__name__, "size": len(args["xbytes"])},
+    )
+    def from_bytes(cls, xbytes, trusted=False):
+        """
+        Create a BLS entity from the binary representation.
+
+        Both the native and (for points) the compressed encodings are accepted.
+        Untrusted point bytes are checked with `is_well_formed` first, so that
+        malformed input is rejected without a native call.
+
+        With `trusted` set, decoding is lazy: the bytes are kept as given and
+        both decompression and the native decoding, which still validates
+        fully, happen when the entity is first used. Only the `is_well_formed`
+        check is skipped. This saves the work for entities that are loaded but
+        never used, and `as_bytes` returns the given encoding without decoding,
+        but errors in trusted bytes surface on first use, such as in
+        `Bls.verify`.
+
+        Decompression runs in Python and is not made cheaper by `trusted`: a
+        compressed G2 point (`VerKey`, `Generator`) takes about 1 ms to reload,
+        far more than the native decoding of its uncompressed encoding. Store
+        uncompressed points where reload speed matters.
+
+        :param xbytes: Bytes representation of Bls entity
+        :param trusted: Whether to decode lazily, on first use
+        :return: BLS entity intance
+        """
+        LOGGER.debug("BlsEntity::from_bytes: >>> trusted: %r", trusted)
+
+        codec = _POINT_CODECS.get(cls.point_group)
+        compressed = codec is not None and len(xbytes) == codec.compressed_size
+
+        if trusted:
+            if compressed:
+                res = cls(None)
+                res._compressed = bytes(xbytes)
+            else:
+                res = cls(None, bytes(xbytes))
+        else:
+            if codec is not None:
+                if not codec.is_well_formed(xbytes):
+                    raise IndyBlsError(
+                        f"Malformed {cls.__name__} bytes", ErrorCode.InvalidStructure
+                    )
+                if compressed:
+                    try:
+                        xbytes = codec.decompress(xbytes)
+                    except ValueError as e:
+                        raise IndyBlsError(str(e), ErrorCode.InvalidStructure) from e
+
+            c_instance = c_void_p()
+            do_call(cls.from_bytes_handler, xbytes, len(xbytes), byref(c_instance))
+            res = cls(c_instance)
 
         LOGGER.debug("BlsEntity::from_bytes: <<< res: %r", res)
         return res
 
-    def as_bytes(self):
+    @trace.traced(
+        "BlsEntity.as_bytes",
+        lambda args: {"entity": type(args["self"]).__name__},
+    )
+    def as_bytes(self, compressed=False):
         """
         Return the BLS entity bytes representation.
 
+        :param compressed: Whether to return the compressed point encoding
         :return: BLS entity bytes representation
         """
         LOGGER.debug("BlsEntity.as_bytes: >>> self: %r", self)
 
-        xbytes = POINTER(c_ubyte)()
-        xbytes_len = c_int32()
-
-        do_call(
-            self.as_bytes_handler, self.c_instance, byref(xbytes), byref(xbytes_len)
-        )
-        res = bytes(xbytes[: xbytes_len.value])
+        if compressed and self._compressed is not None:
+            LOGGER.debug("BlsEntity.as_bytes: <<<")
+            return self._compressed
+
+        if self._decompressed() is None:
+            xbytes = POINTER(c_ubyte)()
+            xbytes_len = c_int32()
+
+            do_call(
+                self.as_bytes_handler,
+                self.c_instance,
+                byref(xbytes),
+                byref(xbytes_len),
+            )
+            self._bytes = bytes(xbytes[: xbytes_len.value])
+
+        res = self._bytes
+        if compressed:
+            codec = _POINT_CODECS.get(self.point_group)
+            if codec is None:
+                raise ValueError(f"{type(self).__name__} has no compressed encoding")
+            try:
+                res = self._compressed = codec.compress(res)
+            except ValueError as e:
+                raise IndyBlsError(str(e), ErrorCode.InvalidStructure) from e
 
         LOGGER.debug("BlsEntity.as_bytes: <<<")
         return res
 
+    def _canonical_digest(self):
+        """
+        Return the digest of the native encoding, computing it on first use.
+
+        Trusted bytes are decoded natively first, so that only valid entities
+        compare equal. Once computed, the digest outlives `release`, and unlike
+        the encoding it does not reveal a sign key.
+        """
+        if self._canonical is None:
+            self.c_instance
+            self._canonical = hashlib.sha256(self.as_bytes()).digest()
+        return self._canonical
+
+    def __eq__(self, other):
+        """
+        Compare entities by the digest of their native encoding.
+
+        The comparison takes constant time, so it is safe for sign keys.
+        Comparing or hashing a trusted entity
+        decodes it, and an entity must be compared or hashed before it is
+        released to stay usable as a set member or dictionary key.
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        return hmac.compare_digest(
+            self._canonical_digest(), other._canonical_digest()
+        )
+
+    def __hash__(self):
+        """Hash the entity by its encoding."""
+        return hash(self._canonical_digest())
+
 
 class Generator(BlsEntity):
     """
@@ -76,10 +329,13 @@ class Generator(BlsEntity):
     all parties. Most methods require the generator to be provided.
     """
 
+    __slots__ = ()
+
     new_handler = "indy_bls_generator_new"
     from_bytes_handler = "indy_bls_generator_from_bytes"
     as_bytes_handler = "indy_bls_generator_as_bytes"
     free_handler = "indy_bls_generator_free"
+    point_group = "G2"
 
     @classmethod
     def new(cls):
@@ -98,6 +354,8 @@ class Generator(BlsEntity):
 class SignKey(BlsEntity):
     """BLS signing key."""
 
+    __slots__ = ()
+
     new_handler = "indy_bls_sign_key_new"
     from_bytes_handler = "indy_bls_sign_key_from_bytes"
     as_bytes_handler = "indy_bls_sign_key_as_bytes"
@@ -128,14 +386,51 @@ class SignKey(BlsEntity):
         LOGGER.debug("SignKey::new: <<< res: %r", res)
         return res
 
+    def split(self, threshold: int, count: int) -> List["SignKey"]:
+        """
+        Split the sign key into Shamir shares.
+
+        Any `threshold` of the returned shares can produce signatures that
+        combine (see `ThresholdSignature.combine`) into a signature of this key.
+        Share `i` of the result has the index `i + 1`.
+
+        :param: threshold - Number of shares required to sign
+        :param: count - Number of shares to create
+        :return: List of share sign keys
+        """
+        LOGGER.debug(
+            "SignKey.split: >>> self: %r, threshold: %r, count: %r",
+            self,
+            threshold,
+            count,
+        )
+        if not 1 <= threshold <= count:
+            raise ValueError("threshold must be between 1 and count")
+
+        coefficients = [scalar_from_bytes(self.as_bytes())]
+        coefficients.extend(
+            secrets.randbelow(CURVE_ORDER) for _ in range(threshold - 1)
+        )
+
+        res = [
+            SignKey.from_bytes(scalar_to_bytes(poly_eval(coefficients, index)))
+            for index in range(1, count + 1)
+        ]
+
+        LOGGER.debug("SignKey.split: <<< res: %r", res)
+        return res
+
 
 class VerKey(BlsEntity):
     """BLS verification key."""
 
+    __slots__ = ()
+
     new_handler = "indy_bls_ver_key_new"
     from_bytes_handler = "indy_bls_ver_key_from_bytes"
     as_bytes_handler = "indy_bls_ver_key_as_bytes"
     free_handler = "indy_bls_ver_key_free"
+    point_group = "G2"
 
     @classmethod
     def new(cls, gen, sign_key):
@@ -160,10 +455,13 @@ class VerKey(BlsEntity):
 class ProofOfPossession(BlsEntity):
     """BLS proof of possession."""
 
+    __slots__ = ()
+
     new_handler = "indy_bls_pop_new"
     from_bytes_handler = "indy_bls_pop_from_bytes"
     as_bytes_handler = "indy_bls_pop_as_bytes"
     free_handler = "indy_bls_pop_free"
+    point_group = "G1"
 
     @classmethod
     def new(cls, ver_key, sign_key):
@@ -190,30 +488,57 @@ class ProofOfPossession(BlsEntity):
 class Signature(BlsEntity):
     """BLS signature."""
 
+    __slots__ = ()
+
     new_handler = None
     from_bytes_handler = "indy_bls_signature_from_bytes"
     as_bytes_handler = "indy_bls_signature_as_bytes"
     free_handler = "indy_bls_signature_free"
+    point_group = "G1"
 
 
 class MultiSignature(BlsEntity):
     """BLS multi signature."""
 
+    __slots__ = ()
+
     new_handler = "indy_bls_multi_signature_new"
     from_bytes_handler = "indy_bls_multi_signature_from_bytes"
     as_bytes_handler = "indy_bls_multi_signature_as_bytes"
     free_handler = "indy_bls_multi_signature_free"
+    point_group = "G1"
 
     @classmethod
-    def new(cls, signatures):
+    def new(cls, signatures, ver_keys=None, pool=None):
         """
         Create and return a BLS multi signature.
 
+        When the verification keys of the signers are given, the signatures are
+        weighted with the rogue-key-safe aggregation coefficients (see
+        `Bls.aggregation_coefficients`). Such a multi signature must be verified
+        with `Bls.verify_multi_sig(..., weighted=True)` and the same pool.
+
         :param: signature - List of signatures
+        :param: ver_keys - Optional distinct verification key of each signer
+        :param: pool - Verification keys of the whole validator set, required
+            with `ver_keys`
         :return: BLS multi signature
         """
         LOGGER.debug("MultiSignature::new: >>>")
 
+        if ver_keys is not None:
+            if len(ver_keys) != len(signatures):
+                raise ValueError("signatures and ver_keys must have the same length")
+            if pool is None:
+                raise ValueError("pool is required for weighted aggregation")
+            coefficients = Bls.aggregation_coefficients(ver_keys, pool)
+            weighted = Bls.msm(signatures, coefficients)
+            res = cls.from_bytes(weighted.as_bytes(), trusted=True)
+            weighted.release()
+
+            LOGGER.debug("MultiSignature::new: <<< res: %r", res)
+            return res
+
         # noinspection PyCallingNonCallable,PyTypeChecker
         signature_c_instances = (c_void_p * len(signatures))()
         for i in range(len(signatures)):
@@ -233,10 +558,172 @@ class MultiSignature(BlsEntity):
         return res
 
 
+def _g1_sum(signatures):
+    """Add signature points with a single native aggregation, into a new entity."""
+    if len(signatures) == 1:
+        return Signature.from_bytes(signatures[0].as_bytes(), trusted=True)
+    with MultiSignature.new(signatures) as multi_sig:
+        # Native output needs no well-formedness check
+        return Signature.from_bytes(multi_sig.as_bytes(), trusted=True)
+
+
+def _g2_sum(points):
+    """Add Jacobian G2 points in Python, the native library has no G2 addition."""
+    res = None
+    for point in points:
+        res = g2_add(res, point)
+    return res
+
+
+def _key_set(ver_keys) -> Tuple[bytes, ...]:
+    """Return the canonical (sorted, deduplicated) encoding of a key set."""
+    return tuple(sorted({ver_key.as_bytes() for ver_key in ver_keys}))
+
+
+def _distinct_keys(ver_keys) -> List[bytes]:
+    """Return the encodings of signer keys, rejecting duplicates."""
+    keys = [ver_key.as_bytes() for ver_key in ver_keys]
+    if len(set(keys)) != len(keys):
+        raise ValueError("ver_keys must be distinct")
+    return keys
+
+
+@lru_cache(maxsize=16)
+def _pool_coefficients(pool: Tuple[bytes, ...]) -> Dict[bytes, int]:
+    """Compute the aggregation coefficient H(key, pool) of each pool key."""
+    h = hashlib.sha256()
+    for key in pool:
+        h.update(len(key).to_bytes(8, "big"))
+        h.update(key)
+    pool_digest = h.digest()
+
+    return {
+        key: int.from_bytes(hashlib.sha256(key + pool_digest).digest()[:16], "big")
+        for key in pool
+    }
+
+
+@lru_cache(maxsize=16)
+def _pool_weighted_keys(pool: Tuple[bytes, ...]) -> Dict[bytes, "VerKey"]:
+    """Compute the weighted verification key of each pool key natively."""
+    coefficients = _pool_coefficients(pool)
+    res = {}
+    for key in pool:
+        gen = Generator.from_bytes(key, trusted=True)
+        coefficient = SignKey.from_bytes(scalar_to_bytes(coefficients[key]))
+        # A verification key is the generator multiplied by the sign key
+        res[key] = VerKey.new(gen, coefficient)
+        gen.release()
+        coefficient.release()
+    return res
+
+
+def _pool_lookup(table: dict, keys: List[bytes]) -> list:
+    """Look up the pool entries of signer keys."""
+    try:
+        return [table[key] for key in keys]
+    except KeyError:
+        raise ValueError("ver_keys must be members of the pool") from None
+
+
+class ThresholdSignature:
+    """Provides threshold (t-of-n) signature methods."""
+
+    @staticmethod
+    def combine(shares, indices):
+        """
+        Combine signature shares into a signature of the shared key.
+
+        The result verifies with `Bls.verify` against the verification key of
+        the sign key that was split with `SignKey.split`.
+
+        :param: shares - List of signatures created with share sign keys
+        :param: indices - Share index (starting from 1) of each signature
+        :return: Signature
+        """
+        LOGGER.debug(
+            "ThresholdSignature::combine: >>> shares: %r, indices: %r", shares, indices
+        )
+        if not shares:
+            raise ValueError("at least one share is required")
+        if len(shares) != len(indices):
+            raise ValueError("shares and indices must have the same length")
+
+        res = Bls.msm(shares, lagrange_coefficients(indices))
+
+        LOGGER.debug("ThresholdSignature::combine: <<< res: %r", res)
+        return res
+
+
 class Bls:
     """Provides BLS methods."""
 
     @staticmethod
+    def aggregation_coefficients(ver_keys, pool):
+        """
+        Return the rogue-key-safe aggregation coefficient of each key.
+
+        The coefficient of a key is a 128-bit hash of the key and the whole
+        validator set (pool), so it is independent of the order of the keys and
+        of which subset signs. Coefficients are cached per pool.
+
+        :param: ver_keys - List of distinct verification keys
+        :param: pool - Verification keys of the whole validator set
+        :return: List of integer coefficients
+        """
+        keys = _distinct_keys(ver_keys)
+        return _pool_lookup(_pool_coefficients(_key_set(pool)), keys)
+
+    @staticmethod
+    @trace.traced("Bls.msm", lambda args: {"count": len(args["points"])})
+    def msm(points, scalars, window=None):
+        """
+        Compute the multi-scalar multiplication of entity points.
+
+        Uses Pippenger's bucket method. Signature points (G1) are summed with
+        native aggregation, key points (G2) with Python arithmetic.
+
+        :param: points - List of G1 (Signature, MultiSignature, ProofOfPossession)
+            or G2 (VerKey, Generator) entities of the same type
+        :param: scalars - Integer scalar for each point
+        :param: window - Optional bucket window size in bits
+        :return: Weighted sum as an entity of the type of the points
+        """
+        LOGGER.debug("Bls::msm: >>> points: %r, scalars: %r", points, scalars)
+        if not points:
+            raise ValueError("at least one point is required")
+        if len(points) != len(scalars):
+            raise ValueError("points and scalars must have the same length")
+
+        cls = type(points[0])
+        if any(type(point) is not cls for point in points):
+            raise ValueError("points must all have the same type")
+
+        if cls.point_group == "G1":
+            if cls is not Signature:
+                points = [
+                    Signature.from_bytes(point.as_bytes(), trusted=True)
+                    for point in points
+                ]
+            res = pippenger(points, scalars, _g1_sum, window)
+            if res is not None and cls is not Signature:
+                res = cls.from_bytes(res.as_bytes(), trusted=True)
+        elif cls.point_group == "G2":
+            points = [g2_from_affine(decode_g2(p.as_bytes())) for p in points]
+            res = pippenger(points, scalars, _g2_sum, window)
+            if res is not None:
+                res = cls.from_bytes(encode_g2(g2_to_affine(res)))
+        else:
+            raise ValueError(f"{cls.__name__} is not a curve point")
+
+        if res is None:
+            raise IndyBlsError("Multi-scalar multiplication result is the identity")
+
+        LOGGER.debug("Bls::msm: <<< res: %r", res)
+        return res
+
+    @staticmethod
+    @trace.traced("Bls.sign", lambda args: {"message_size": len(args["message"])})
     def sign(message, sign_key):
         """
         Sign the message and return the signature.
@@ -262,6 +749,7 @@ class Bls:
         return res
 
     @staticmethod
+    @trace.traced("Bls.verify", lambda args: {"message_size": len(args["message"])})
     def verify(signature, message, ver_key, gen):
         """
         Verify the message signature.
@@ -296,6 +784,7 @@ class Bls:
         return res
 
     @staticmethod
+    @trace.traced("Bls.verify_pop")
     def verify_pop(pop, ver_key, gen):
         """
         Verifiy the proof of possession.
@@ -323,14 +812,33 @@ class Bls:
         return res
 
     @staticmethod
-    def verify_multi_sig(multi_sig, message, ver_keys, gen):
+    @trace.traced(
+        "Bls.verify_multi_sig",
+        lambda args: {
+            "message_size": len(args["message"]),
+            "ver_keys": len(args["ver_keys"]),
+        },
+    )
+    def verify_multi_sig(
+        multi_sig, message, ver_keys, gen, cache=None, weighted=False, pool=None
+    ):
         """
         Verifiy the message multi signature.
 
-                :param: multi_sig - Multi signature to verify
+        A weighted multi signature (see `MultiSignature.new`) is verified against
+        the signer keys weighted by their aggregation coefficients. The weighted
+        keys are computed once per pool and cached, so each verification only
+        selects the signer subset. Weighted aggregation is safe against rogue
+        key attacks without verifying a proof of possession for each key.
+
+        :param: multi_sig - Multi signature to verify
         :param: message - Message to verify
         :param: ver_keys - List of verification keys
         :param: gen - Generator point
+        :param: cache - Optional VerificationCache of successful verifications
+        :param: weighted - Whether the multi signature uses weighted aggregation
+        :param: pool - Verification keys of the whole validator set, required
+            for weighted aggregation
         :return: true if the multi signature is valid, false otherwise
         """
         LOGGER.debug(
@@ -344,6 +852,20 @@ class Bls:
             gen,
         )
 
+        if weighted:
+            if pool is None:
+                raise ValueError("pool is required for weighted aggregation")
+            weighted_keys = _pool_weighted_keys(_key_set(pool))
+            ver_keys = _pool_lookup(weighted_keys, _distinct_keys(ver_keys))
+
+        digest = None
+        if cache is not None:
+            digest = cache.digest(multi_sig, message, ver_keys, gen)
+            if cache.get(digest):
+                res = c_bool(True)
+                LOGGER.debug("Bls::verify_multi_sig: <<< res: %r (cached)", res)
+                return res
+
         # noinspection PyCallingNonCallable,PyTypeChecker
         ver_key_c_instances = (c_void_p * len(ver_keys))()
         for i in range(len(ver_keys)):
@@ -362,6 +884,8 @@ class Bls:
         )
 
         res = valid
+        if digest is not None and res:
+            cache.add(digest)
 
         LOGGER.debug("Bls::verify_multi_sig: <<< res: %r", res)
         return res
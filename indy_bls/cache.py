@@ -0,0 +1,135 @@
+"""Verification result cache."""
+
+import hashlib
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CacheStats(NamedTuple):
+    """Snapshot of the verification cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class VerificationCache:
+    """
+    Bounded cache of successful signature verifications.
+
+    Entries are keyed by a digest of the signature, the message, the set of
+    verification keys and the generator. Only positive results are stored, so
+    a cache hit can stand in for a native verification while a miss always
+    falls through to it. Entries are evicted in least recently used order once
+    `max_size` is reached and, if `ttl` is set, once they are older than `ttl`
+    seconds.
+    """
+
+    def __init__(
+        self, max_size: int = 1024, ttl: Optional[float] = None, clock=time.monotonic
+    ):
+        """
+        Initializer.
+
+        :param: max_size - Maximum number of cached entries
+        :param: ttl - Optional entry lifetime in seconds
+        :param: clock - Time source returning seconds
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def digest(signature, message, ver_keys, gen) -> bytes:
+        """
+        Compute the cache key for a verification.
+
+        The key set is treated as unordered, matching the aggregation performed
+        by the native multi signature verification.
+
+        :param: signature - Signature or multi signature
+        :param: message - Signed message
+        :param: ver_keys - List of verification keys
+        :param: gen - Generator point
+        :return: Cache key digest
+        """
+        h = hashlib.sha256()
+        for part in (signature.as_bytes(), message, gen.as_bytes()):
+            h.update(len(part).to_bytes(8, "big"))
+            h.update(part)
+        key_bytes = sorted(ver_key.as_bytes() for ver_key in ver_keys)
+        h.update(len(key_bytes).to_bytes(8, "big"))
+        for part in key_bytes:
+            h.update(len(part).to_bytes(8, "big"))
+            h.update(part)
+        return h.digest()
+
+    def get(self, digest: bytes) -> bool:
+        """
+        Check whether a verification is cached as successful.
+
+        :param: digest - Cache key digest
+        :return: true on a cache hit, false otherwise
+        """
+        with self._lock:
+            expires = self._entries.get(digest)
+            if expires is not None and self._clock() >= expires:
+                del self._entries[digest]
+                self._evictions += 1
+                expires = None
+            if expires is None:
+                self._misses += 1
+                return False
+            self._entries.move_to_end(digest)
+            self._hits += 1
+            return True
+
+    def add(self, digest: bytes):
+        """
+        Record a successful verification.
+
+        :param: digest - Cache key digest
+        """
+        expires = self._clock() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[digest] = expires
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Drop all cached entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit, miss and eviction counters."""
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, len(self._entries)
+            )
+
+    def __len__(self):
+        """Return the number of cached entries."""
+        with self._lock:
+            return len(self._entries)
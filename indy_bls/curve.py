@@ -0,0 +1,385 @@
+"""BN254 curve parameters and scalar helpers."""
+
+from typing import List, Sequence
+
+MODBYTES = 32
+"""Size in bytes of a field element or scalar."""
+
+CURVE_ORDER = 0x2523648240000001BA344D8000000007FF9F800000000010A10000000000000D
+"""Order of the BN254 groups, the modulus of sign keys."""
+
+
+def scalar_to_bytes(value: int) -> bytes:
+    """Encode a scalar in the sign key representation (big-endian, reduced)."""
+    return (value % CURVE_ORDER).to_bytes(MODBYTES, "big")
+
+
+def scalar_from_bytes(xbytes: bytes) -> int:
+    """Decode a scalar from the sign key representation."""
+    return int.from_bytes(xbytes, "big") % CURVE_ORDER
+
+
+def poly_eval(coefficients: Sequence[int], x: int) -> int:
+    """Evaluate a polynomial (constant term first) at `x` modulo the group order."""
+    res = 0
+    for c in reversed(coefficients):
+        res = (res * x + c) % CURVE_ORDER
+    return res
+
+
+def lagrange_coefficients(indices: Sequence[int]) -> List[int]:
+    """
+    Return the Lagrange coefficients for interpolating at zero.
+
+    :param: indices - Distinct, non-zero share indices
+    :return: Coefficient for each index, in the same order
+    """
+    if len(set(indices)) != len(indices):
+        raise ValueError("share indices must be distinct")
+    if any(i % CURVE_ORDER == 0 for i in indices):
+        raise ValueError("share indices must be non-zero")
+
+    res = []
+    for i in indices:
+        num = den = 1
+        for j in indices:
+            if j != i:
+                num = num * j % CURVE_ORDER
+                den = den * (j - i) % CURVE_ORDER
+        res.append(num * pow(den, CURVE_ORDER - 2, CURVE_ORDER) % CURVE_ORDER)
+    return res
+
+
+FIELD_MODULUS = 0x2523648240000001BA344D80000000086121000000000013A700000000000013
+"""Modulus of the BN254 base field."""
+
+G1_BYTES = 4 * MODBYTES
+"""Size of the native (uncompressed) G1 point encoding."""
+
+G2_BYTES = 4 * MODBYTES
+"""Size of the native (uncompressed) G2 point encoding."""
+
+G1_COMPRESSED_BYTES = MODBYTES + 1
+"""Size of the compressed G1 point encoding: parity prefix and x coordinate."""
+
+G2_COMPRESSED_BYTES = 2 * MODBYTES
+"""Size of the compressed G2 point encoding: flagged x coordinate."""
+
+_P = FIELD_MODULUS
+_P_BYTES = FIELD_MODULUS.to_bytes(MODBYTES, "big")
+_G1_B = 2
+_G2_B = (1, _P - 1)  # 2 / (1 + i), the D-type sextic twist of b
+_G2_SIGN_FLAG = 0x80
+
+
+def _fp_sqrt(a):
+    """Return a square root of `a` modulo p, or None (p = 3 mod 4)."""
+    res = pow(a, (_P + 1) // 4, _P)
+    return res if res * res % _P == a % _P else None
+
+
+def fp2_mul(x, y):
+    """Multiply elements of Fp2 = Fp[i] / (i^2 + 1)."""
+    return (
+        (x[0] * y[0] - x[1] * y[1]) % _P,
+        (x[0] * y[1] + x[1] * y[0]) % _P,
+    )
+
+
+def fp2_add(x, y):
+    """Add elements of Fp2."""
+    return ((x[0] + y[0]) % _P, (x[1] + y[1]) % _P)
+
+
+def fp2_sub(x, y):
+    """Subtract elements of Fp2."""
+    return ((x[0] - y[0]) % _P, (x[1] - y[1]) % _P)
+
+
+def fp2_inv(x):
+    """Invert a non-zero element of Fp2."""
+    norm_inv = pow(x[0] * x[0] + x[1] * x[1], _P - 2, _P)
+    return (x[0] * norm_inv % _P, -x[1] * norm_inv % _P)
+
+
+def _fp2_sqrt(a):
+    """Return a square root of `a` in Fp2, or None."""
+    u, v = a
+    if v == 0:
+        root = _fp_sqrt(u)
+        if root is not None:
+            return (root, 0)
+        root = _fp_sqrt(-u % _P)
+        return (0, root) if root is not None else None
+
+    norm = _fp_sqrt((u * u + v * v) % _P)
+    if norm is None:
+        return None
+    half = pow(2, _P - 2, _P)
+    x0 = _fp_sqrt((u + norm) * half % _P)
+    if x0 is None:
+        x0 = _fp_sqrt((u - norm) * half % _P)
+        if x0 is None:
+            return None
+    x1 = v * pow(2 * x0, _P - 2, _P) % _P
+    return (x0, x1)
+
+
+def _fp2_sign(y):
+    return (y[0] if y[0] else y[1]) & 1
+
+
+def _g1_rhs(x):
+    return (x * x * x + _G1_B) % _P
+
+
+def _g2_rhs(x):
+    return fp2_add(fp2_mul(fp2_mul(x, x), x), _G2_B)
+
+
+def _int(xbytes, index):
+    return int.from_bytes(xbytes[index * MODBYTES : (index + 1) * MODBYTES], "big")
+
+
+def decode_g1(xbytes: bytes):
+    """Decode native G1 point bytes into affine (x, y) integers."""
+    if len(xbytes) != G1_BYTES or xbytes[0] != 0x04 or any(xbytes[2 * MODBYTES + 1 :]):
+        raise ValueError("invalid G1 point encoding")
+    return _int(xbytes[1:], 0), _int(xbytes[1:], 1)
+
+
+def encode_g1(point) -> bytes:
+    """Encode affine (x, y) integers as native G1 point bytes."""
+    x, y = point
+    return (
+        b"\x04"
+        + x.to_bytes(MODBYTES, "big")
+        + y.to_bytes(MODBYTES, "big")
+        + bytes(G1_BYTES - 2 * MODBYTES - 1)
+    )
+
+
+def decode_g2(xbytes: bytes):
+    """Decode native G2 point bytes into affine ((xa, xb), (ya, yb)) integers."""
+    if len(xbytes) != G2_BYTES:
+        raise ValueError("invalid G2 point encoding")
+    return (_int(xbytes, 0), _int(xbytes, 1)), (_int(xbytes, 2), _int(xbytes, 3))
+
+
+def encode_g2(point) -> bytes:
+    """Encode affine ((xa, xb), (ya, yb)) integers as native G2 point bytes."""
+    (xa, xb), (ya, yb) = point
+    return b"".join(c.to_bytes(MODBYTES, "big") for c in (xa, xb, ya, yb))
+
+
+def compress_g1(xbytes: bytes) -> bytes:
+    """Compress native G1 point bytes to the parity-prefixed x coordinate."""
+    x, y = decode_g1(xbytes)
+    if y * y % _P != _g1_rhs(x):
+        raise ValueError("G1 point is not on the curve")
+    return bytes([0x02 | (y & 1)]) + xbytes[1 : MODBYTES + 1]
+
+
+def decompress_g1(xbytes: bytes) -> bytes:
+    """Recover native G1 point bytes from the compressed encoding."""
+    if len(xbytes) != G1_COMPRESSED_BYTES or xbytes[0] not in (0x02, 0x03):
+        raise ValueError("invalid compressed G1 point encoding")
+    x = _int(xbytes[1:], 0)
+    y = _fp_sqrt(_g1_rhs(x)) if x < _P else None
+    if y is None:
+        raise ValueError("G1 point is not on the curve")
+    if y & 1 != xbytes[0] & 1:
+        y = _P - y
+    return encode_g1((x, y))
+
+
+def compress_g2(xbytes: bytes) -> bytes:
+    """Compress native G2 point bytes to the x coordinate with a sign flag."""
+    x, y = decode_g2(xbytes)
+    if fp2_mul(y, y) != _g2_rhs(x):
+        raise ValueError("G2 point is not on the curve")
+    flags = _G2_SIGN_FLAG if _fp2_sign(y) else 0
+    return bytes([xbytes[0] | flags]) + xbytes[1:G2_COMPRESSED_BYTES]
+
+
+def decompress_g2(xbytes: bytes) -> bytes:
+    """Recover native G2 point bytes from the compressed encoding."""
+    if len(xbytes) != G2_COMPRESSED_BYTES:
+        raise ValueError("invalid compressed G2 point encoding")
+    sign = 1 if xbytes[0] & _G2_SIGN_FLAG else 0
+    x = (_int(bytes([xbytes[0] & ~_G2_SIGN_FLAG]) + xbytes[1:], 0), _int(xbytes, 1))
+    y = _fp2_sqrt(_g2_rhs(x)) if max(x) < _P else None
+    if y is None:
+        raise ValueError("G2 point is not on the curve")
+    if _fp2_sign(y) != sign:
+        y = ((_P - y[0]) % _P, (_P - y[1]) % _P)
+    return encode_g2((x, y))
+
+
+def g2_from_affine(point):
+    """Convert an affine G2 point to Jacobian coordinates."""
+    x, y = point
+    return (x, y, (1, 0))
+
+
+def g2_to_affine(point):
+    """Convert a Jacobian G2 point (not at infinity) to affine coordinates."""
+    x, y, z = point
+    z_inv = fp2_inv(z)
+    z_inv2 = fp2_mul(z_inv, z_inv)
+    return fp2_mul(x, z_inv2), fp2_mul(y, fp2_mul(z_inv2, z_inv))
+
+
+def g2_double(point):
+    """Double a Jacobian G2 point, None being the point at infinity."""
+    if point is None:
+        return None
+    x, y, z = point
+    if y == (0, 0):
+        return None
+    a = fp2_mul(x, x)
+    b = fp2_mul(y, y)
+    c = fp2_mul(b, b)
+    t = fp2_add(x, b)
+    d = fp2_sub(fp2_sub(fp2_mul(t, t), a), c)
+    d = fp2_add(d, d)
+    e = fp2_add(fp2_add(a, a), a)
+    f = fp2_mul(e, e)
+    x3 = fp2_sub(f, fp2_add(d, d))
+    c8 = fp2_add(c, c)
+    c8 = fp2_add(c8, c8)
+    c8 = fp2_add(c8, c8)
+    y3 = fp2_sub(fp2_mul(e, fp2_sub(d, x3)), c8)
+    z3 = fp2_mul(y, z)
+    return x3, y3, fp2_add(z3, z3)
+
+
+def g2_add(p, q):
+    """Add Jacobian G2 points, None being the point at infinity."""
+    if p is None:
+        return q
+    if q is None:
+        return p
+    x1, y1, z1 = p
+    x2, y2, z2 = q
+    z1z1 = fp2_mul(z1, z1)
+    z2z2 = fp2_mul(z2, z2)
+    u1 = fp2_mul(x1, z2z2)
+    u2 = fp2_mul(x2, z1z1)
+    s1 = fp2_mul(y1, fp2_mul(z2, z2z2))
+    s2 = fp2_mul(y2, fp2_mul(z1, z1z1))
+    if u1 == u2:
+        return g2_double(p) if s1 == s2 else None
+    h = fp2_sub(u2, u1)
+    i = fp2_add(h, h)
+    i = fp2_mul(i, i)
+    j = fp2_mul(h, i)
+    r = fp2_sub(s2, s1)
+    r = fp2_add(r, r)
+    v = fp2_mul(u1, i)
+    x3 = fp2_sub(fp2_sub(fp2_mul(r, r), j), fp2_add(v, v))
+    s1j = fp2_mul(s1, j)
+    y3 = fp2_sub(fp2_mul(r, fp2_sub(v, x3)), fp2_add(s1j, s1j))
+    z3 = fp2_add(z1, z2)
+    z3 = fp2_mul(fp2_sub(fp2_sub(fp2_mul(z3, z3), z1z1), z2z2), h)
+    return x3, y3, z3
+
+
+def _window_size(count: int) -> int:
+    if count < 4:
+        return 1
+    return min(16, max(2, count.bit_length() - 2))
+
+
+def pippenger(points, scalars, add_all, window: int = None):
+    """
+    Compute the multi-scalar multiplication `sum(s * P)` with buckets.
+
+    Each `window`-bit slice of the scalars sorts the points into buckets by
+    digit. Buckets are summed with one `add_all` call each and then weighted
+    by their digit with running sums, so the number of group operations grows
+    as about `len(points) * 254 / window` rather than `len(points) * 254`.
+
+    :param: points - Group elements
+    :param: scalars - Integer scalar for each point
+    :param: add_all - Function returning the sum of a non-empty list of points
+    :param: window - Optional window size in bits
+    :return: The weighted sum, or None for the identity
+    """
+    pairs = [(p, s % CURVE_ORDER) for p, s in zip(points, scalars)]
+    pairs = [(p, s) for p, s in pairs if s]
+    if not pairs:
+        return None
+
+    c = window or _window_size(len(pairs))
+    mask = (1 << c) - 1
+    bits = max(s.bit_length() for _, s in pairs)
+
+    res = None
+    for offset in reversed(range(0, bits, c)):
+        if res is not None:
+            for _ in range(c):
+                res = add_all([res, res])
+
+        buckets = [[] for _ in range(mask + 1)]
+        for p, s in pairs:
+            digit = (s >> offset) & mask
+            if digit:
+                buckets[digit].append(p)
+
+        running = window_sum = None
+        for digit in range(mask, 0, -1):
+            if buckets[digit]:
+                if running is not None:
+                    buckets[digit].append(running)
+                running = add_all(buckets[digit])
+            if running is not None:
+                window_sum = (
+                    running if window_sum is None else add_all([window_sum, running])
+                )
+
+        if window_sum is not None:
+            res = window_sum if res is None else add_all([res, window_sum])
+
+    return res
+
+
+def _below_p(xbytes: bytes, index: int) -> bool:
+    return xbytes[index * MODBYTES : (index + 1) * MODBYTES] < _P_BYTES
+
+
+def is_well_formed_g1(xbytes: bytes) -> bool:
+    """
+    Check the structure of native or compressed G1 point bytes.
+
+    Only the length, the prefix, the padding and the coordinate range are
+    checked, not whether the point is on the curve.
+    """
+    size = len(xbytes)
+    if size == G1_COMPRESSED_BYTES:
+        return xbytes[0] in (0x02, 0x03) and _below_p(xbytes[1:], 0)
+    if size == G1_BYTES:
+        body = xbytes[1:]
+        return (
+            xbytes[0] == 0x04
+            and _below_p(body, 0)
+            and _below_p(body, 1)
+            and not any(body[2 * MODBYTES :])
+        )
+    return False
+
+
+def is_well_formed_g2(xbytes: bytes) -> bool:
+    """
+    Check the structure of native or compressed G2 point bytes.
+
+    Only the length, the flags and the coordinate range are checked, not whether
+    the point is on the curve.
+    """
+    size = len(xbytes)
+    if size == G2_COMPRESSED_BYTES:
+        xa = bytes([xbytes[0] & ~_G2_SIGN_FLAG]) + xbytes[1:MODBYTES]
+        return _below_p(xa, 0) and _below_p(xbytes, 1)
+    if size == G2_BYTES:
+        return all(_below_p(xbytes, i) for i in range(4))
+    return False
@@ -1,5 +1,44 @@
 """Error classes."""
 
+import json
+
+from typing import Optional
+
 
 class IndyBlsError(Exception):
     """Base class for library errors."""
+
+    def __init__(
+        self,
+        message: Optional[str] = None,
+        code: Optional[int] = None,
+        error_json: Optional[bytes] = None,
+    ):
+        """
+        Initializer.
+
+        :param: message - Error message
+        :param: code - Error code, see `ErrorCode`
+        :param: error_json - Native error details, decoded when the message is
+            first requested
+        """
+        super().__init__(message)
+        self.code = code
+        self._message = message
+        self._error_json = error_json
+
+    @property
+    def message(self) -> Optional[str]:
+        """Return the error message."""
+        if self._message is None and self._error_json is not None:
+            self._message = json.loads(self._error_json)["message"]
+            self.args = (self._message,)
+        return self._message
+
+    def __str__(self):
+        """Return the error message."""
+        return self.message or ""
+
+    def __repr__(self):
+        """Return the error message and code."""
+        return f"{type(self).__name__}({self.message!r}, code={self.code!r})"
@@ -1,6 +1,5 @@
 """Raw library bindings."""
 
-import json
 import os.path
 import logging
 import sys
@@ -10,6 +9,7 @@ from ctypes.util import find_library
 from enum import IntEnum
 from logging import ERROR, WARNING, INFO, DEBUG
 
+from . import trace
 from .error import IndyBlsError
 
 LOGGER = logging.getLogger()
@@ -22,21 +22,30 @@ class ErrorCode(IntEnum):
     Success = 0
     Fail = 1
 
+    # Raised by the wrapper without calling into the library
+    InvalidStructure = -1
 
-def do_call(name, *args):
-    """Perform an FFI method call."""
+
+def do_call(name, *args, traced=True):
+    """
+    Perform an FFI method call.
+
+    Calls with `traced` unset, such as frees run from finalizers, are left out
+    of tracing.
+    """
     # LOGGER.debug("do_call: >>> name: %r, args: %r", name, args)
 
     lib = _cdll()
-    err = getattr(lib, name)(*args)
+    func = getattr(lib, name)
+    err = trace.native_call(name, func, args) if traced else func(*args)
 
     if err != ErrorCode.Success:
         LOGGER.debug("do_call: Function %r returned err: %r", name, err)
         err_msg = c_char_p()
         lib.indy_bls_get_current_error(byref(err_msg))
-        err_json = err_msg.value.decode("utf-8")
+        err_json = err_msg.value
         lib.indy_bls_string_free(err_msg)
-        raise IndyBlsError(json.loads(err_json)["message"])
+        raise IndyBlsError(code=err, error_json=err_json)
 
 
 def _cdll():
@@ -67,7 +76,7 @@ def _load_cdll() -> CDLL:
         lib_suffix = lib_suffix_mapping[os_name]
     except KeyError:
         LOGGER.error("_load_cdll: OS isn't supported: %s", os_name)
-        raise IndyBlsError("OS isn't supported: %s", os_name)
+        raise IndyBlsError(f"OS isn't supported: {os_name}")
 
     lib_filename = f"{lib_prefix}{lib_name}{lib_suffix}"
     LOGGER.debug("_load_cdll: Resolved library name is: %s", lib_filename)
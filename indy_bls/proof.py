@@ -0,0 +1,205 @@
+"""Packed multi signature proof format."""
+
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Tuple
+
+from .bls import Bls, MultiSignature
+from .curve import G1_BYTES, G1_COMPRESSED_BYTES
+from .error import IndyBlsError
+from .lib import ErrorCode
+
+
+class MultiSigProof(NamedTuple):
+    """Multi signature over a message digest with its participants."""
+
+    signature: MultiSignature
+    participants: Tuple[int, ...]
+    digest: bytes
+
+    def verify(self, ver_keys, gen, cache=None):
+        """
+        Verify the proof.
+
+        :param: ver_keys - Verification keys of the whole pool, indexed by the
+            participant numbers
+        :param: gen - Generator point
+        :param: cache - Optional VerificationCache of successful verifications
+        :return: true if the multi signature is valid, false otherwise
+        """
+        return Bls.verify_multi_sig(
+            self.signature,
+            self.digest,
+            [ver_keys[i] for i in self.participants],
+            gen,
+            cache=cache,
+        )
+
+
+class MultiSigProofCodec:
+    """
+    Fixed-width binary codec of multi signature proofs.
+
+    Each record holds the signature, the message digest and a bitmap of the
+    participants within a pool of `pool_size` members. Records have no framing,
+    so a buffer of proofs is their concatenation and record `i` starts at
+    `i * record_size`.
+
+    Compressed signatures take 33 instead of 128 bytes, but decoding them needs
+    a modular square root in Python, which costs far more CPU per record than
+    the native decoding of uncompressed signatures. Signatures are therefore
+    stored uncompressed unless `compressed` is set.
+    """
+
+    def __init__(self, pool_size: int, digest_size: int = 32, compressed=False):
+        """
+        Initializer.
+
+        :param: pool_size - Number of pool members that may participate
+        :param: digest_size - Size in bytes of the message digests
+        :param: compressed - Whether to store compressed signatures, trading
+            decoding CPU for size
+        """
+        if pool_size <= 0:
+            raise ValueError("pool_size must be positive")
+        if digest_size <= 0:
+            raise ValueError("digest_size must be positive")
+
+        self.pool_size = pool_size
+        self.digest_size = digest_size
+        self.compressed = compressed
+        self.signature_size = G1_COMPRESSED_BYTES if compressed else G1_BYTES
+        self.bitmap_size = (pool_size + 7) // 8
+        self.record_size = self.signature_size + digest_size + self.bitmap_size
+
+    def encode_into(self, proof: MultiSigProof, buf, offset: int = 0):
+        """
+        Encode a proof into a writable buffer.
+
+        :param: proof - Proof to encode
+        :param: buf - Writable buffer with room for `record_size` bytes
+        :param: offset - Offset of the record within the buffer
+        """
+        if offset < 0 or offset + self.record_size > len(buf):
+            raise ValueError("buffer too small for the record")
+        if len(proof.digest) != self.digest_size:
+            raise ValueError("digest has an unexpected size")
+        signature = proof.signature.as_bytes(compressed=self.compressed)
+        if len(signature) != self.signature_size:
+            raise ValueError("signature has an unexpected size")
+
+        bitmap = 0
+        for i in proof.participants:
+            if not 0 <= i < self.pool_size:
+                raise ValueError(f"participant out of range: {i}")
+            if bitmap >> i & 1:
+                raise ValueError(f"duplicate participant: {i}")
+            bitmap |= 1 << i
+
+        end = offset + self.signature_size
+        buf[offset:end] = signature
+        buf[end : end + self.digest_size] = proof.digest
+        end += self.digest_size
+        buf[end : end + self.bitmap_size] = bitmap.to_bytes(self.bitmap_size, "little")
+
+    def encode(self, proof: MultiSigProof) -> bytes:
+        """Encode a proof as a single record."""
+        buf = bytearray(self.record_size)
+        self.encode_into(proof, buf)
+        return bytes(buf)
+
+    def encode_all(self, proofs: Iterable[MultiSigProof]) -> bytearray:
+        """
+        Encode proofs into a contiguous buffer.
+
+        :param: proofs - Proofs to encode
+        :return: Buffer holding the records in order
+        """
+        proofs = list(proofs)
+        buf = bytearray(self.record_size * len(proofs))
+        for i, proof in enumerate(proofs):
+            self.encode_into(proof, buf, i * self.record_size)
+        return buf
+
+    def decode(self, buf, offset: int = 0, trusted=False) -> MultiSigProof:
+        """
+        Decode a proof record.
+
+        :param: buf - Buffer holding the record
+        :param: offset - Offset of the record within the buffer
+        :param: trusted - Whether to defer decoding the signature, see
+            `BlsEntity.from_bytes`
+        :return: Proof
+        """
+        view = memoryview(buf)[offset : offset + self.record_size]
+        if len(view) != self.record_size:
+            raise IndyBlsError("Truncated proof record", ErrorCode.InvalidStructure)
+
+        end = self.signature_size
+        signature = MultiSignature.from_bytes(bytes(view[:end]), trusted=trusted)
+        digest = bytes(view[end : end + self.digest_size])
+        end += self.digest_size
+        bitmap = int.from_bytes(view[end:], "little")
+        if bitmap >> self.pool_size:
+            raise IndyBlsError("Participant out of range", ErrorCode.InvalidStructure)
+
+        participants = tuple(
+            i for i, bit in enumerate(reversed(bin(bitmap)[2:])) if bit == "1"
+        )
+        return MultiSigProof(signature, participants, digest)
+
+    def iter_decode(self, buf, trusted=False) -> Iterator[MultiSigProof]:
+        """
+        Decode the proofs of a contiguous buffer lazily.
+
+        :param: buf - Buffer holding whole records
+        :param: trusted - Whether to defer decoding the signatures
+        :return: Iterator of proofs
+        """
+        if len(buf) % self.record_size:
+            raise IndyBlsError("Truncated proof record", ErrorCode.InvalidStructure)
+        for offset in range(0, len(buf), self.record_size):
+            yield self.decode(buf, offset, trusted)
+
+    def decode_all(self, buf, trusted=False) -> List[MultiSigProof]:
+        """Decode the proofs of a contiguous buffer."""
+        return list(self.iter_decode(buf, trusted))
+
+    def write(self, fp: BinaryIO, proofs: Iterable[MultiSigProof], batch=4096):
+        """
+        Write proofs to a binary file.
+
+        :param: fp - Binary file open for writing
+        :param: proofs - Proofs to write
+        :param: batch - Number of records written per call
+        """
+        buf = bytearray(self.record_size * batch)
+        count = 0
+        for proof in proofs:
+            self.encode_into(proof, buf, count * self.record_size)
+            count += 1
+            if count == batch:
+                fp.write(buf)
+                count = 0
+        if count:
+            fp.write(memoryview(buf)[: count * self.record_size])
+
+    def read(self, fp: BinaryIO, trusted=False, batch=4096) -> Iterator[MultiSigProof]:
+        """
+        Read proofs from a binary file.
+
+        :param: fp - Binary file open for reading
+        :param: trusted - Whether to defer decoding the signatures
+        :param: batch - Number of records read per call
+        :return: Iterator of proofs
+        """
+        pending = b""
+        while True:
+            chunk = fp.read(self.record_size * batch)
+            if not chunk:
+                break
+            buf = pending + chunk
+            whole = len(buf) - len(buf) % self.record_size
+            yield from self.iter_decode(memoryview(buf)[:whole], trusted)
+            pending = buf[whole:]
+
+        if pending:
+            raise IndyBlsError("Truncated proof record", ErrorCode.InvalidStructure)
@@ -0,0 +1,250 @@
+"""Tracing hooks for profiling library calls."""
+
+import functools
+import inspect
+import threading
+import time
+
+from typing import Callable, Optional
+
+_TRACER = None
+_LOCAL = threading.local()
+
+
+class Span:
+    """
+    Timing record of a traced call.
+
+    The wall time of the call is split into `prepare` (from the start until the
+    first native call), `native` (spent inside native calls), `convert` (from
+    the end of the last native call until the finish) and `other` (Python time
+    between native calls). Times are in seconds. `attributes` holds call
+    details such as the sizes of the arguments and results.
+    """
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "start_time",
+        "duration",
+        "prepare",
+        "native",
+        "convert",
+        "native_calls",
+        "parent",
+        "_start",
+        "_first_native",
+        "_last_native",
+    )
+
+    def __init__(self, name: str, attributes: dict, parent: Optional["Span"]):
+        """Initializer."""
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.start_time = time.time()
+        self.duration = self.prepare = self.native = self.convert = 0.0
+        self.native_calls = 0
+        self._first_native = self._last_native = None
+        self._start = time.perf_counter()
+
+    @property
+    def other(self) -> float:
+        """Return the Python time spent between native calls."""
+        return max(0.0, self.duration - self.prepare - self.native - self.convert)
+
+    def set(self, **attributes):
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+
+    def _add_native(self, start: float, end: float):
+        if self._first_native is None:
+            self._first_native = start
+        self._last_native = end
+        self.native += end - start
+        self.native_calls += 1
+
+    def _finish(self):
+        end = time.perf_counter()
+        self.duration = end - self._start
+        if self._first_native is None:
+            self.prepare = self.duration
+        else:
+            self.prepare = self._first_native - self._start
+            self.convert = end - self._last_native
+
+    def __repr__(self):
+        """Return a debug representation."""
+        return (
+            f"Span({self.name!r}, duration={self.duration:.6f}, "
+            f"prepare={self.prepare:.6f}, native={self.native:.6f}, "
+            f"convert={self.convert:.6f}, attributes={self.attributes!r})"
+        )
+
+
+class _NullSpan:
+    """Span stand-in used while tracing is disabled."""
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    def __init__(self, tracer, span):
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self):
+        _stack().append(self.span)
+        return self.span
+
+    def __exit__(self, *exc):
+        _stack().pop()
+        self.span._finish()
+        self.tracer(self.span)
+
+
+def _stack():
+    stack = getattr(_LOCAL, "stack", None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+def set_tracer(tracer: Optional[Callable[[Span], None]]):
+    """
+    Install a tracer receiving each finished span, or None to disable tracing.
+
+    The tracer is called on the thread that made the call. Exceptions raised by
+    the tracer propagate to the caller.
+
+    :param: tracer - Callable accepting a finished Span
+    """
+    global _TRACER
+    _TRACER = tracer
+
+
+def get_tracer() -> Optional[Callable[[Span], None]]:
+    """Return the installed tracer."""
+    return _TRACER
+
+
+def span(name: str, **attributes):
+    """
+    Return a context manager tracing the enclosed block as a span.
+
+    While tracing is disabled a shared no-op span is returned.
+
+    :param: name - Span name
+    :param: attributes - Initial span attributes
+    """
+    tracer = _TRACER
+    if tracer is None:
+        return _NULL_SPAN
+    stack = _stack()
+    return _ActiveSpan(tracer, Span(name, attributes, stack[-1] if stack else None))
+
+
+def native_call(name: str, func, args):
+    """
+    Perform a native call, recording its time in the active spans.
+
+    A call made outside of any span is reported as a span of its own.
+    """
+    tracer = _TRACER
+    if tracer is None:
+        return func(*args)
+
+    stack = _stack()
+    if not stack:
+        with span(name, native=True):
+            return native_call(name, func, args)
+
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        end = time.perf_counter()
+        for active in stack:
+            active._add_native(start, end)
+
+
+def traced(name: str, attributes: Callable[[dict], dict] = None):
+    """
+    Decorate a function to run in a span while tracing is enabled.
+
+    :param: name - Span name
+    :param: attributes - Optional callable receiving the call arguments, bound
+        to the parameter names, and returning span attributes such as argument
+        sizes
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _TRACER is None:
+                return func(*args, **kwargs)
+            with span(name) as active:
+                if attributes is not None:
+                    try:
+                        bound = signature.bind(*args, **kwargs)
+                    except TypeError:
+                        # Let the call itself report the invalid arguments
+                        pass
+                    else:
+                        bound.apply_defaults()
+                        active.set(**attributes(bound.arguments))
+                res = func(*args, **kwargs)
+                if isinstance(res, bytes):
+                    active.set(result_size=len(res))
+                return res
+
+        return wrapper
+
+    return decorator
+
+
+class OpenTelemetryTracer:
+    """
+    Tracer exporting spans through OpenTelemetry.
+
+    Requires the `opentelemetry-api` package. Install it with
+    `set_tracer(OpenTelemetryTracer())`.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        Initializer.
+
+        :param: tracer - Optional OpenTelemetry tracer, defaults to the tracer
+            of the global tracer provider
+        """
+        if tracer is None:
+            from opentelemetry import trace as otel_trace
+
+            tracer = otel_trace.get_tracer("indy_bls")
+        self.tracer = tracer
+
+    def __call__(self, span: Span):
+        """Export a finished span."""
+        start = int(span.start_time * 1e9)
+        otel_span = self.tracer.start_span(span.name, start_time=start)
+        for key, value in span.attributes.items():
+            otel_span.set_attribute(f"indy_bls.{key}", value)
+        otel_span.set_attribute("indy_bls.prepare_ns", int(span.prepare * 1e9))
+        otel_span.set_attribute("indy_bls.native_ns", int(span.native * 1e9))
+        otel_span.set_attribute("indy_bls.convert_ns", int(span.convert * 1e9))
+        otel_span.set_attribute("indy_bls.native_calls", span.native_calls)
+        otel_span.end(end_time=start + int(span.duration * 1e9))
+
@@ -1,6 +1,9 @@
+import pytest
+
 from indy_bls import (
     Bls,
     SignKey,
+    Signature,
     VerKey,
     MultiSignature,
 )
@@ -49,3 +52,45 @@ def test_verify_multi_sig_works_for_invalid_signature(generator, message):
         multi_signature_invalid, message, [ver_key1, ver_key2], generator
     )
     assert not valid
+
+
+def test_msm_signatures(signature1, signature2, multi_sig):
+    res = Bls.msm([signature1, signature2], [1, 1])
+    assert type(res) is Signature
+    assert res.as_bytes() == multi_sig.as_bytes()
+
+    res = Bls.msm([signature1], [3])
+    expected = MultiSignature.new([signature1, signature1, signature1])
+    assert res.as_bytes() == expected.as_bytes()
+
+
+def test_msm_weighted_verify(generator, message, ver_key1, signature1):
+    scalar = 0x1234567890ABCDEF
+    signature = Bls.msm([signature1], [scalar])
+    ver_key = Bls.msm([ver_key1], [scalar])
+    assert type(ver_key) is VerKey
+    assert Bls.verify(signature, message, ver_key, generator)
+
+
+def test_msm_ver_keys(generator, message, multi_sig, ver_key1, ver_key2):
+    ver_key = Bls.msm([ver_key1, ver_key2], [1, 1])
+    signature = Signature.from_bytes(multi_sig.as_bytes())
+    assert Bls.verify(signature, message, ver_key, generator)
+
+
+def test_msm_invalid(signature1, ver_key1):
+    with pytest.raises(ValueError):
+        Bls.msm([], [])
+    with pytest.raises(ValueError):
+        Bls.msm([signature1, ver_key1], [1, 1])
+
+
+def test_msm_returns_new_entity(signature1, multi_sig):
+    res = Bls.msm([signature1], [1])
+    assert res is not signature1
+    assert res.as_bytes() == signature1.as_bytes()
+
+    res = Bls.msm([multi_sig], [1])
+    assert type(res) is MultiSignature
+    assert res is not multi_sig
+    assert res.as_bytes() == multi_sig.as_bytes()
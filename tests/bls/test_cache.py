@@ -0,0 +1,98 @@
+import pytest
+
+from indy_bls import Bls, VerificationCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_miss_then_hit():
+    cache = VerificationCache()
+    assert not cache.get(b"a")
+
+    cache.add(b"a")
+    assert cache.get(b"a")
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_lru_eviction():
+    cache = VerificationCache(max_size=2)
+    cache.add(b"a")
+    cache.add(b"b")
+    assert cache.get(b"a")
+
+    cache.add(b"c")
+    assert cache.get(b"a")
+    assert not cache.get(b"b")
+    assert cache.get(b"c")
+    assert cache.stats.evictions == 1
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = VerificationCache(ttl=10, clock=clock)
+    cache.add(b"a")
+
+    clock.now = 9
+    assert cache.get(b"a")
+
+    clock.now = 10
+    assert not cache.get(b"a")
+    assert len(cache) == 0
+
+
+def test_clear():
+    cache = VerificationCache()
+    cache.add(b"a")
+    cache.get(b"a")
+
+    cache.clear()
+    assert cache.stats == (0, 0, 0, 0)
+
+
+def test_invalid_params():
+    with pytest.raises(ValueError):
+        VerificationCache(max_size=0)
+    with pytest.raises(ValueError):
+        VerificationCache(ttl=0)
+
+
+def test_digest_ignores_key_order(generator, message, multi_sig, ver_key1, ver_key2):
+    digest1 = VerificationCache.digest(
+        multi_sig, message, [ver_key1, ver_key2], generator
+    )
+    digest2 = VerificationCache.digest(
+        multi_sig, message, [ver_key2, ver_key1], generator
+    )
+    assert digest1 == digest2
+
+    digest3 = VerificationCache.digest(multi_sig, message, [ver_key1], generator)
+    assert digest1 != digest3
+
+
+def test_verify_multi_sig_cached(generator, message, multi_sig, ver_key1, ver_key2):
+    cache = VerificationCache()
+    for _ in range(3):
+        valid = Bls.verify_multi_sig(
+            multi_sig, message, [ver_key1, ver_key2], generator, cache=cache
+        )
+        assert valid
+
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 2
+
+
+def test_verify_multi_sig_invalid_not_cached(generator, multi_sig, ver_key1, ver_key2):
+    cache = VerificationCache()
+    valid = Bls.verify_multi_sig(
+        multi_sig, b"other", [ver_key1, ver_key2], generator, cache=cache
+    )
+    assert not valid
+    assert len(cache) == 0
@@ -0,0 +1,74 @@
+import pytest
+
+from indy_bls.curve import (
+    CURVE_ORDER,
+    FIELD_MODULUS,
+    compress_g1,
+    compress_g2,
+    decompress_g1,
+    decompress_g2,
+    encode_g1,
+    encode_g2,
+    pippenger,
+)
+
+
+def _g1_point(x):
+    while True:
+        rhs = (x**3 + 2) % FIELD_MODULUS
+        y = pow(rhs, (FIELD_MODULUS + 1) // 4, FIELD_MODULUS)
+        if y * y % FIELD_MODULUS == rhs:
+            return x, y
+        x += 1
+
+
+def test_g1_compression_roundtrip():
+    x, y = _g1_point(5)
+    for point in ((x, y), (x, FIELD_MODULUS - y)):
+        xbytes = encode_g1(point)
+        compressed = compress_g1(xbytes)
+        assert len(compressed) == 33
+        assert decompress_g1(compressed) == xbytes
+
+
+def test_g1_compression_rejects_invalid():
+    x, y = _g1_point(5)
+    with pytest.raises(ValueError):
+        compress_g1(encode_g1((x, y + 1)))
+    with pytest.raises(ValueError):
+        decompress_g1(b"\x05" + bytes(32))
+
+
+def test_g2_compression_rejects_invalid():
+    with pytest.raises(ValueError):
+        compress_g2(encode_g2(((1, 2), (3, 4))))
+    with pytest.raises(ValueError):
+        decompress_g2(bytes(63))
+
+
+def test_g2_compression_roundtrip():
+    for k in range(1, 100):
+        compressed = (1).to_bytes(32, "big") + k.to_bytes(32, "big")
+        try:
+            xbytes = decompress_g2(compressed)
+        except ValueError:
+            continue
+        assert compress_g2(xbytes) in (compressed, bytes([0x80]) + compressed[1:])
+        assert decompress_g2(compress_g2(xbytes)) == xbytes
+        return
+    pytest.fail("no G2 point found")
+
+
+@pytest.mark.parametrize("count", [1, 3, 50])
+@pytest.mark.parametrize("window", [None, 1, 5])
+def test_pippenger_scalar_group(count, window):
+    # The scalars modulo the group order form a group with the same order
+    points = [(7 * i + 3) ** 5 % CURVE_ORDER for i in range(count)]
+    scalars = [(11 * i + 1) ** 9 % CURVE_ORDER for i in range(count)]
+
+    res = pippenger(points, scalars, lambda xs: sum(xs) % CURVE_ORDER, window)
+    assert res == sum(p * s for p, s in zip(points, scalars)) % CURVE_ORDER
+
+
+def test_pippenger_zero_scalars():
+    assert pippenger([1, 2], [0, CURVE_ORDER], sum) is None
@@ -0,0 +1,21 @@
+from indy_bls import ErrorCode, IndyBlsError
+
+
+def test_message():
+    err = IndyBlsError("failed", ErrorCode.Fail)
+    assert str(err) == "failed"
+    assert err.code == ErrorCode.Fail
+
+
+def test_native_message():
+    err = IndyBlsError(code=ErrorCode.Fail, error_json=b'{"message": "failed"}')
+    assert repr(err) == f"IndyBlsError('failed', code={ErrorCode.Fail!r})"
+    assert str(err) == "failed"
+    assert err.message == "failed"
+    assert err.args == ("failed",)
+
+
+def test_repr_without_message():
+    err = IndyBlsError(code=ErrorCode.Fail)
+    assert repr(err) == f"IndyBlsError(None, code={ErrorCode.Fail!r})"
+    assert str(err) == ""
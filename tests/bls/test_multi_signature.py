@@ -1,4 +1,6 @@
-from indy_bls import MultiSignature
+import pytest
+
+from indy_bls import Bls, MultiSignature, SignKey, VerKey
 
 
 def test_new(multi_sig):
@@ -18,3 +20,76 @@ def test_from_bytes(multi_sig):
 
     xbytes2 = multi_sig2.as_bytes()
     assert xbytes == xbytes2
+
+
+def test_aggregation_coefficients(ver_key1, ver_key2):
+    pool = [ver_key1, ver_key2]
+    coefficients = Bls.aggregation_coefficients([ver_key1, ver_key2], pool)
+    assert len(coefficients) == 2
+    assert coefficients[0] != coefficients[1]
+    assert all(0 < c < 2**128 for c in coefficients)
+
+    reversed_pool = [ver_key2, ver_key1]
+    assert Bls.aggregation_coefficients(reversed_pool, pool) == coefficients[::-1]
+    assert Bls.aggregation_coefficients([ver_key2], pool) == coefficients[1:]
+    assert Bls.aggregation_coefficients([ver_key1], [ver_key1]) != coefficients[:1]
+
+
+def test_new_weighted(
+    generator, message, signature1, signature2, ver_key1, ver_key2, multi_sig
+):
+    pool = [ver_key1, ver_key2]
+    weighted = MultiSignature.new([signature1, signature2], pool, pool)
+    assert type(weighted) is MultiSignature
+    assert weighted.as_bytes() != multi_sig.as_bytes()
+
+    ver_keys = [ver_key2, ver_key1]
+    assert Bls.verify_multi_sig(
+        weighted, message, ver_keys, generator, weighted=True, pool=pool
+    )
+    assert not Bls.verify_multi_sig(weighted, message, ver_keys, generator)
+    assert not Bls.verify_multi_sig(
+        multi_sig, message, ver_keys, generator, weighted=True, pool=pool
+    )
+
+
+def test_new_weighted_invalid(generator, message, signature1, ver_key1, ver_key2):
+    pool = [ver_key1, ver_key2]
+    with pytest.raises(ValueError):
+        MultiSignature.new([signature1], pool, pool)
+    with pytest.raises(ValueError):
+        MultiSignature.new([signature1], [ver_key1])
+
+    weighted = MultiSignature.new([signature1], [ver_key1], pool)
+    with pytest.raises(ValueError):
+        Bls.verify_multi_sig(weighted, message, [ver_key1], generator, weighted=True)
+
+
+def test_new_weighted_pool(generator, message, signature1, ver_key1, ver_key2):
+    ver_key3 = VerKey.new(generator, SignKey.new(None))
+    pool = [ver_key1, ver_key2, ver_key3]
+
+    weighted = MultiSignature.new([signature1], [ver_key1], pool)
+    assert Bls.verify_multi_sig(
+        weighted, message, [ver_key1], generator, weighted=True, pool=pool
+    )
+    assert not Bls.verify_multi_sig(
+        weighted, message, [ver_key1], generator, weighted=True, pool=[ver_key1]
+    )
+
+    with pytest.raises(ValueError):
+        Bls.verify_multi_sig(
+            weighted, message, [ver_key1], generator, weighted=True, pool=[ver_key2]
+        )
+
+
+def test_new_weighted_duplicate_keys(generator, message, signature1, ver_key1):
+    pool = [ver_key1]
+    with pytest.raises(ValueError):
+        MultiSignature.new([signature1, signature1], [ver_key1, ver_key1], pool)
+
+    weighted = MultiSignature.new([signature1], [ver_key1], pool)
+    with pytest.raises(ValueError):
+        Bls.verify_multi_sig(
+            weighted, message, [ver_key1, ver_key1], generator, weighted=True, pool=pool
+        )
@@ -0,0 +1,106 @@
+import io
+
+import pytest
+
+from indy_bls import (
+    Bls,
+    ErrorCode,
+    IndyBlsError,
+    MultiSignature,
+    MultiSigProof,
+    MultiSigProofCodec,
+)
+
+
+@pytest.fixture
+def proofs(sign_key1):
+    return [
+        MultiSigProof(
+            MultiSignature.new([Bls.sign(bytes([i]) * 32, sign_key1)]),
+            tuple(range(i % 5, 10, 2)),
+            bytes([i]) * 32,
+        )
+        for i in range(10)
+    ]
+
+
+def _assert_same(decoded, proofs):
+    assert len(decoded) == len(proofs)
+    for proof, other in zip(decoded, proofs):
+        assert proof.signature.as_bytes() == other.signature.as_bytes()
+        assert proof.participants == other.participants
+        assert proof.digest == other.digest
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+def test_roundtrip(proofs, compressed):
+    codec = MultiSigProofCodec(10, compressed=compressed)
+    buf = codec.encode_all(proofs)
+    assert len(buf) == codec.record_size * len(proofs)
+    assert codec.encode(proofs[1]) == buf[codec.record_size : 2 * codec.record_size]
+
+    _assert_same(codec.decode_all(buf, trusted=True), proofs)
+
+
+def test_record_size():
+    assert MultiSigProofCodec(25).record_size == 128 + 32 + 4
+    assert MultiSigProofCodec(25, compressed=True).record_size == 33 + 32 + 4
+
+
+def test_file_roundtrip(proofs):
+    codec = MultiSigProofCodec(10)
+    fp = io.BytesIO()
+    codec.write(fp, proofs, batch=3)
+
+    fp.seek(0)
+    _assert_same(list(codec.read(fp, trusted=True, batch=4)), proofs)
+
+
+def test_truncated(proofs):
+    codec = MultiSigProofCodec(10)
+    buf = codec.encode_all(proofs)
+
+    with pytest.raises(IndyBlsError) as exc_info:
+        codec.decode_all(buf[:-1], trusted=True)
+    assert exc_info.value.code == ErrorCode.InvalidStructure
+
+    with pytest.raises(IndyBlsError):
+        list(codec.read(io.BytesIO(buf[:-1]), trusted=True))
+
+
+def test_invalid_participants(proofs):
+    codec = MultiSigProofCodec(10)
+    with pytest.raises(ValueError):
+        codec.encode(proofs[0]._replace(participants=(10,)))
+    with pytest.raises(ValueError):
+        codec.encode(proofs[0]._replace(participants=(1, 3, 1)))
+
+    buf = bytearray(codec.encode(proofs[0]))
+    buf[-1] |= 0x80
+    with pytest.raises(IndyBlsError):
+        codec.decode(buf, trusted=True)
+
+
+def test_encode_into_invalid(proofs):
+    codec = MultiSigProofCodec(10)
+    with pytest.raises(ValueError):
+        codec.encode_into(proofs[0], bytearray(codec.record_size - 1))
+    with pytest.raises(ValueError):
+        codec.encode_into(proofs[0], bytearray(codec.record_size), 1)
+
+    signature = MultiSignature.from_bytes(
+        proofs[0].signature.as_bytes()[:-1], trusted=True
+    )
+    buf = bytearray(codec.record_size)
+    with pytest.raises(ValueError):
+        codec.encode_into(proofs[0]._replace(signature=signature), buf)
+    assert len(buf) == codec.record_size
+
+
+def test_verify(generator, message, multi_sig, ver_key1, ver_key2):
+    codec = MultiSigProofCodec(3, digest_size=len(message))
+    proof = MultiSigProof(multi_sig, (0, 2), message)
+
+    (decoded,) = codec.decode_all(codec.encode_all([proof]))
+    assert decoded.verify([ver_key1, None, ver_key2], generator)
+    assert not decoded.verify([ver_key1, ver_key2, ver_key1], generator)
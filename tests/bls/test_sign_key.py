@@ -1,4 +1,6 @@
-from indy_bls import SignKey
+import pytest
+
+from indy_bls import IndyBlsError, SignKey
 
 
 def test_new(sign_key1):
@@ -22,3 +24,27 @@ def test_from_bytes(sign_key1):
 
     xbytes2 = sign_key12.as_bytes()
     assert xbytes == xbytes2
+
+
+def test_as_bytes_compressed(sign_key1):
+    with pytest.raises(ValueError):
+        sign_key1.as_bytes(compressed=True)
+
+
+def test_eq_hash(sign_key1, sign_key2):
+    sign_key12 = SignKey.from_bytes(sign_key1.as_bytes())
+    assert sign_key12 == sign_key1
+    assert sign_key12 != sign_key2
+    assert hash(sign_key12) == hash(sign_key1)
+
+
+def test_release(sign_key1):
+    sign_key12 = SignKey.from_bytes(sign_key1.as_bytes())
+    assert sign_key12.as_bytes() == sign_key1.as_bytes()
+    assert sign_key12 == sign_key1
+    sign_key12.release()
+
+    # The cached secret is dropped, the equality digest is kept
+    with pytest.raises(IndyBlsError):
+        sign_key12.as_bytes()
+    assert sign_key12 == sign_key1
@@ -1,4 +1,9 @@
-from indy_bls import Signature
+import threading
+
+import pytest
+
+from indy_bls import Bls, ErrorCode, IndyBlsError, Signature
+from indy_bls.curve import FIELD_MODULUS, decompress_g1
 
 
 def test_new(signature1):
@@ -22,3 +27,98 @@ def test_from_bytes(signature1):
 
     xbytes2 = signature12.as_bytes()
     assert xbytes == xbytes2
+
+
+def test_as_bytes_compressed(signature1):
+    xbytes = signature1.as_bytes(compressed=True)
+    assert len(xbytes) < len(signature1.as_bytes())
+
+    signature12 = Signature.from_bytes(xbytes)
+    assert signature12.as_bytes() == signature1.as_bytes()
+
+
+def test_from_bytes_trusted(generator, message, ver_key1, signature1):
+    signature12 = Signature.from_bytes(signature1.as_bytes(), trusted=True)
+    assert signature12.as_bytes() == signature1.as_bytes()
+    assert Bls.verify(signature12, message, ver_key1, generator)
+
+
+def test_from_bytes_trusted_concurrent_use(signature1):
+    signature12 = Signature.from_bytes(signature1.as_bytes(), trusted=True)
+    barrier = threading.Barrier(4)
+    c_instances = []
+
+    def use():
+        barrier.wait()
+        c_instances.append(signature12.c_instance)
+
+    threads = [threading.Thread(target=use) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(c_instances) == 4
+    assert all(c_instance is c_instances[0] for c_instance in c_instances)
+
+
+def test_release(signature1):
+    signature12 = Signature.from_bytes(signature1.as_bytes())
+    signature12.release()
+
+    with pytest.raises(IndyBlsError):
+        signature12.c_instance
+
+
+def test_release_idempotent(signature1):
+    signature12 = Signature.from_bytes(signature1.as_bytes())
+    with signature12:
+        pass
+    signature12.release()
+
+    with pytest.raises(IndyBlsError):
+        signature12.as_bytes()
+
+
+def test_is_well_formed(signature1):
+    xbytes = signature1.as_bytes()
+    assert Signature.is_well_formed(xbytes)
+    assert Signature.is_well_formed(signature1.as_bytes(compressed=True))
+    assert Signature.check_well_formed([xbytes, xbytes[:-1]]) == [True, False]
+
+
+def test_is_well_formed_garbage():
+    assert not Signature.is_well_formed(b"")
+    assert not Signature.is_well_formed(b"\x05" + bytes(32))
+    assert not Signature.is_well_formed(b"\x04" + b"\xff" * 64 + bytes(63))
+
+
+def test_from_bytes_malformed():
+    with pytest.raises(IndyBlsError) as exc_info:
+        Signature.from_bytes(b"garbage")
+    assert exc_info.value.code == ErrorCode.InvalidStructure
+
+
+def test_from_bytes_trusted_compressed_is_lazy():
+    x = 1
+    while True:
+        compressed = b"\x03" + x.to_bytes(32, "big")
+        try:
+            xbytes = decompress_g1(compressed)
+        except ValueError:
+            x += 1
+            continue
+        break
+
+    signature = Signature.from_bytes(compressed, trusted=True)
+    assert signature.as_bytes(compressed=True) == compressed
+    assert signature.as_bytes() == xbytes
+
+
+def test_from_bytes_trusted_invalid_fails_on_use():
+    # x = p is out of range, but trusted bytes are not checked up front
+    xbytes = b"\x02" + FIELD_MODULUS.to_bytes(32, "big")
+    signature = Signature.from_bytes(xbytes, trusted=True)
+    with pytest.raises(IndyBlsError) as exc_info:
+        signature.as_bytes()
+    assert exc_info.value.code == ErrorCode.InvalidStructure
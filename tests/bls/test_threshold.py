@@ -0,0 +1,55 @@
+import pytest
+
+from indy_bls import Bls, SignKey, ThresholdSignature, VerKey
+from indy_bls.curve import CURVE_ORDER, lagrange_coefficients, poly_eval
+
+
+def test_lagrange_coefficients_interpolate():
+    coefficients = [12345, 678, 9]
+    indices = [2, 4, 5]
+    lagrange = lagrange_coefficients(indices)
+
+    secret = sum(l * poly_eval(coefficients, i) for l, i in zip(lagrange, indices))
+    assert secret % CURVE_ORDER == 12345
+
+
+def test_lagrange_coefficients_invalid_indices():
+    with pytest.raises(ValueError):
+        lagrange_coefficients([1, 1])
+    with pytest.raises(ValueError):
+        lagrange_coefficients([0, 1])
+
+
+def test_split_invalid_threshold(sign_key1):
+    with pytest.raises(ValueError):
+        sign_key1.split(3, 2)
+
+
+def test_combine(generator, message, sign_key1, ver_key1):
+    shares = sign_key1.split(3, 5)
+    assert len(shares) == 5
+    assert all(type(share) is SignKey for share in shares)
+
+    signatures = [Bls.sign(message, share) for share in shares]
+
+    combined = ThresholdSignature.combine(
+        [signatures[0], signatures[2], signatures[4]], [1, 3, 5]
+    )
+    assert Bls.verify(combined, message, ver_key1, generator)
+
+    combined2 = ThresholdSignature.combine(signatures[1:4], [2, 3, 4])
+    assert combined.as_bytes() == combined2.as_bytes()
+
+
+def test_combine_below_threshold(generator, message, sign_key1, ver_key1):
+    shares = sign_key1.split(3, 5)
+    signatures = [Bls.sign(message, share) for share in shares[:2]]
+
+    combined = ThresholdSignature.combine(signatures, [1, 2])
+    assert not Bls.verify(combined, message, ver_key1, generator)
+
+
+def test_share_ver_key(generator, message, sign_key1):
+    share = sign_key1.split(2, 3)[0]
+    signature = Bls.sign(message, share)
+    assert Bls.verify(signature, message, VerKey.new(generator, share), generator)
@@ -0,0 +1,168 @@
+import time
+
+import pytest
+
+from indy_bls import (
+    Bls,
+    MultiSignature,
+    OpenTelemetryTracer,
+    Signature,
+    get_tracer,
+    set_tracer,
+)
+from indy_bls import trace
+
+
+@pytest.fixture
+def spans():
+    spans = []
+    set_tracer(spans.append)
+    yield spans
+    set_tracer(None)
+
+
+def _native(delay):
+    time.sleep(delay)
+    return 0
+
+
+def test_disabled():
+    assert get_tracer() is None
+    with trace.span("test") as active:
+        active.set(size=1)
+    assert trace.native_call("native", _native, (0,)) == 0
+
+
+def test_span_phases(spans):
+    with trace.span("test", size=3):
+        time.sleep(0.01)
+        trace.native_call("native", _native, (0.02,))
+        time.sleep(0.01)
+
+    assert len(spans) == 1
+    span = spans[0]
+    assert span.name == "test"
+    assert span.attributes == {"size": 3}
+    assert span.native_calls == 1
+    assert span.native >= 0.02
+    assert span.prepare >= 0.01
+    assert span.convert >= 0.01
+    assert span.duration >= span.prepare + span.native + span.convert
+
+
+def test_native_call_outside_span(spans):
+    trace.native_call("native", _native, (0,))
+    assert [span.name for span in spans] == ["native"]
+    assert spans[0].native_calls == 1
+
+
+def test_traced_nested(spans):
+    @trace.traced("inner", lambda args: {"size": len(args["xbytes"])})
+    def inner(xbytes):
+        trace.native_call("native", _native, (0,))
+        return xbytes
+
+    @trace.traced("outer")
+    def outer():
+        inner(b"abc")
+        inner(b"de")
+
+    outer()
+
+    assert [span.name for span in spans] == ["inner", "inner", "outer"]
+    assert spans[0].attributes == {"size": 3, "result_size": 3}
+    assert spans[0].parent is spans[2]
+    assert spans[2].native_calls == 2
+
+
+def test_traced_keyword_arguments(spans):
+    @trace.traced("func", lambda args: {"size": len(args["xbytes"]), "n": args["n"]})
+    def func(prefix, xbytes, n=1):
+        return xbytes * n
+
+    assert func(b"", xbytes=b"ab") == b"ab"
+    assert func(prefix=b"", xbytes=b"a", n=3) == b"aaa"
+    assert [span.attributes for span in spans] == [
+        {"size": 2, "n": 1, "result_size": 2},
+        {"size": 1, "n": 3, "result_size": 3},
+    ]
+
+    with pytest.raises(TypeError):
+        func(b"", other=1)
+
+
+def test_msm_keyword_arguments_traced(signature1, spans):
+    signature = Signature.from_bytes(xbytes=signature1.as_bytes(), trusted=True)
+    Bls.msm(points=[signature], scalars=[1])
+
+    span = [span for span in spans if span.name == "Bls.msm"][0]
+    assert span.attributes == {"count": 1}
+
+
+def test_open_telemetry_tracer(spans):
+    class FakeOtelSpan:
+        def __init__(self, name, start_time):
+            self.name = name
+            self.start_time = start_time
+            self.attributes = {}
+            self.end_time = None
+
+        def set_attribute(self, key, value):
+            self.attributes[key] = value
+
+        def end(self, end_time):
+            self.end_time = end_time
+
+    class FakeOtelTracer:
+        def __init__(self):
+            self.spans = []
+
+        def start_span(self, name, start_time):
+            self.spans.append(FakeOtelSpan(name, start_time))
+            return self.spans[-1]
+
+    otel_tracer = FakeOtelTracer()
+    set_tracer(OpenTelemetryTracer(otel_tracer))
+    with trace.span("test", size=1):
+        trace.native_call("native", _native, (0,))
+
+    (otel_span,) = otel_tracer.spans
+    assert otel_span.name == "test"
+    assert otel_span.attributes["indy_bls.size"] == 1
+    assert otel_span.attributes["indy_bls.native_calls"] == 1
+    assert otel_span.end_time >= otel_span.start_time
+
+
+def test_bls_verify_traced(generator, message, ver_key1, signature1, spans):
+    assert Bls.verify(signature1, message, ver_key1, generator)
+
+    span = spans[-1]
+    assert span.name == "Bls.verify"
+    assert span.attributes["message_size"] == len(message)
+    assert span.native_calls == 1
+
+
+def test_bls_keyword_arguments_traced(generator, message, sign_key1, ver_key1, spans):
+    signature = Bls.sign(message=message, sign_key=sign_key1)
+    assert Bls.verify(signature, message, ver_key=ver_key1, gen=generator)
+    assert Bls.verify_multi_sig(
+        multi_sig=MultiSignature.new([signature]),
+        message=message,
+        ver_keys=[ver_key1],
+        gen=generator,
+    )
+
+    names = [span.name for span in spans if span.name.startswith("Bls.")]
+    assert names == ["Bls.sign", "Bls.verify", "Bls.verify_multi_sig"]
+
+
+def test_free_not_traced(signature1, spans):
+    signature = Signature.from_bytes(signature1.as_bytes())
+    spans.clear()
+
+    with trace.span("test"):
+        signature.release()
+    del signature
+
+    assert [span.name for span in spans] == ["test"]
+    assert spans[0].native_calls == 0
@@ -1,4 +1,6 @@
-from indy_bls import VerKey
+import pytest
+
+from indy_bls import Generator, IndyBlsError, VerKey
 
 
 def test_new(ver_key1):
@@ -22,3 +24,61 @@ def test_from_bytes(ver_key1):
 
     xbytes2 = ver_key12.as_bytes()
     assert xbytes == xbytes2
+
+
+def test_as_bytes_compressed(ver_key1):
+    xbytes = ver_key1.as_bytes(compressed=True)
+    assert len(xbytes) < len(ver_key1.as_bytes())
+
+    ver_key12 = VerKey.from_bytes(xbytes)
+    assert ver_key12.as_bytes() == ver_key1.as_bytes()
+
+
+def test_from_bytes_trusted(ver_key1):
+    ver_key12 = VerKey.from_bytes(ver_key1.as_bytes(compressed=True), trusted=True)
+    assert ver_key12.as_bytes() == ver_key1.as_bytes()
+    assert ver_key12.c_instance is not None
+
+
+def test_is_well_formed(ver_key1):
+    xbytes = ver_key1.as_bytes()
+    assert VerKey.is_well_formed(xbytes)
+    assert VerKey.is_well_formed(ver_key1.as_bytes(compressed=True))
+    assert VerKey.check_well_formed([xbytes, xbytes + b"\x00"]) == [True, False]
+
+
+def test_is_well_formed_garbage():
+    assert not VerKey.is_well_formed(b"")
+    assert not VerKey.is_well_formed(b"\xff" * 128)
+
+
+def test_eq_hash(ver_key1, ver_key2):
+    ver_key12 = VerKey.from_bytes(ver_key1.as_bytes())
+    assert ver_key12 == ver_key1
+    assert ver_key12 != ver_key2
+    assert len({ver_key1, ver_key12, ver_key2}) == 2
+    assert {ver_key1: 1}[ver_key12] == 1
+
+
+def test_eq_hash_released(ver_key1):
+    ver_key = VerKey.from_bytes(ver_key1.as_bytes())
+    ver_keys = {ver_key}
+    ver_key.release()
+
+    assert ver_key in ver_keys
+    assert ver_key1 in ver_keys
+    assert ver_key == ver_key1
+
+
+def test_eq_trusted(ver_key1):
+    ver_key = VerKey.from_bytes(ver_key1.as_bytes(), trusted=True)
+    assert ver_key == ver_key1
+    assert hash(ver_key) == hash(ver_key1)
+
+    xbytes = bytes(range(128))
+    assert VerKey.from_bytes(xbytes, trusted=True) != Generator.from_bytes(
+        xbytes, trusted=True
+    )
+    assert VerKey.from_bytes(xbytes, trusted=True) != xbytes
+    with pytest.raises(IndyBlsError):
+        hash(VerKey.from_bytes(xbytes, trusted=True))